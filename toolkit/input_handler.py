@@ -12,10 +12,36 @@ except ImportError:
 
 
 class InputHandler:
+    # Bytes read ahead of the current key (e.g. the tail of a paste burst)
+    # waiting to be served before the next os.read.
+    _pushback = b""
+
+    @staticmethod
+    def _read_byte(fd):
+        """Read one byte, serving buffered read-ahead bytes first."""
+        if InputHandler._pushback:
+            b = InputHandler._pushback[:1]
+            InputHandler._pushback = InputHandler._pushback[1:]
+            return b
+        return os.read(fd, 1)
+
+    @staticmethod
+    def _has_pending(fd, timeout):
+        """True if a byte is already buffered or readable within timeout."""
+        if InputHandler._pushback:
+            return True
+        return bool(select.select([fd], [], [], timeout)[0])
+
     @staticmethod
     @contextlib.contextmanager
     def _terminal_mode():
-        """Context manager to set terminal to cbreak mode and restore it."""
+        """
+        Context manager to set terminal to cbreak mode and restore it.
+
+        The terminal is reconfigured exactly once on entry and restored with a
+        single tcsetattr on exit; _read_char_raw() only calls os.read() inside
+        this context, so no per-keystroke termios syscalls are paid.
+        """
         if not tty or not sys.stdin.isatty():
             yield
             return
@@ -23,14 +49,26 @@ class InputHandler:
         fd = sys.stdin.fileno()
         old_settings = termios.tcgetattr(fd)
         try:
-            tty.setcbreak(fd)
+            # Equivalent to tty.setcbreak(), spelled out so VMIN/VTIME are
+            # explicit: block until at least 1 byte arrives, no read timer.
+            mode = termios.tcgetattr(fd)
+            mode[3] &= ~(termios.ECHO | termios.ICANON)  # lflags
+            mode[6][termios.VMIN] = 1
+            mode[6][termios.VTIME] = 0
+            termios.tcsetattr(fd, termios.TCSADRAIN, mode)
             yield
         finally:
             termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
 
     @staticmethod
-    def _read_char_raw():
-        """Reads a single char/sequence assuming raw/cbreak mode is active."""
+    def _read_char_raw(batch=False):
+        """
+        Reads a single char/sequence assuming raw/cbreak mode is active.
+
+        With batch=True a run of already-pending printable ASCII (a paste
+        burst) is returned as one string; menu-style callers that match
+        single characters must leave it off.
+        """
         if not tty:
             # Windows fallback
             if os.name == "nt":
@@ -45,7 +83,7 @@ class InputHandler:
 
         fd = sys.stdin.fileno()
         try:
-            b = os.read(fd, 1)
+            b = InputHandler._read_byte(fd)
         except KeyboardInterrupt:
             return "\x03"
 
@@ -53,15 +91,67 @@ class InputHandler:
             return ""
 
         if b == b"\x1b":
-            # Check for escape sequence
-            if select.select([fd], [], [], 0.05)[0]:
-                b += os.read(fd, 1)
-                if select.select([fd], [], [], 0.05)[0]:
-                    b += os.read(fd, 1)
+            # Escape sequence: one short poll then a single wide read
+            # drains the whole sequence (arrows, Home/End, modified arrows
+            # like \x1b[1;5D) in one syscall instead of a select+read pair
+            # per byte. A lone ESC keypress times out and returns bare.
+            def _more():
+                if InputHandler._pushback:
+                    chunk = InputHandler._pushback[:8]
+                    InputHandler._pushback = InputHandler._pushback[8:]
+                    return chunk
+                return os.read(fd, 8)
+
+            if InputHandler._has_pending(fd, 0.05):
+                b += _more()
+                if b[1:2] == b"[":
+                    # CSI ("\x1b[..."): scan to the final byte (0x40-0x7E),
+                    # topping up if the sequence straddled the first read.
+                    end = 2
+                    while True:
+                        if end < len(b):
+                            final = 0x40 <= b[end] <= 0x7E
+                            end += 1
+                            if final:
+                                break
+                        elif InputHandler._has_pending(fd, 0.05):
+                            b += _more()
+                        else:
+                            break
+                else:
+                    # Alt+key (e.g. "\x1bb") is two bytes.
+                    end = 2
+                # Surplus bytes (e.g. a second arrow in the same burst) go
+                # back for the next call.
+                if end < len(b):
+                    InputHandler._pushback = b[end:] + InputHandler._pushback
+                    b = b[:end]
             return b.decode("utf-8", errors="ignore")
 
-        # Handle UTF-8 multi-byte characters
         first = ord(b)
+
+        # Plain printable ASCII: slurp any bytes already pending (a paste
+        # burst) in 64-byte reads and return the whole printable run at
+        # once, instead of one syscall per character. Bytes past the run
+        # (Enter, escape sequences) are pushed back for the next call.
+        if batch and 0x20 <= first <= 0x7E:
+            while InputHandler._has_pending(fd, 0):
+                if InputHandler._pushback:
+                    b += InputHandler._pushback
+                    InputHandler._pushback = b""
+                else:
+                    chunk = os.read(fd, 64)
+                    if not chunk:
+                        break
+                    b += chunk
+            for i, byte in enumerate(b):
+                if not 0x20 <= byte <= 0x7E:
+                    InputHandler._pushback = b[i:] + InputHandler._pushback
+                    b = b[:i]
+                    break
+            return b.decode("utf-8", errors="ignore")
+
+        # Handle UTF-8 multi-byte characters
         to_read = 0
         if (first & 0xE0) == 0xC0:
             to_read = 1
@@ -71,8 +161,8 @@ class InputHandler:
             to_read = 3
 
         while to_read > 0:
-            if select.select([fd], [], [], 0.05)[0]:
-                b += os.read(fd, 1)
+            if InputHandler._has_pending(fd, 0.05):
+                b += InputHandler._read_byte(fd)
                 to_read -= 1
             else:
                 break
@@ -94,26 +184,34 @@ class InputHandler:
         sys.stdout.write(prompt)
         sys.stdout.flush()
 
+        # Echo straight to the stdout fd: one write syscall per keystroke,
+        # skipping the TextIOWrapper encode/buffer/flush layers. Anything
+        # buffered above (the prompt) was flushed already.
+        out_fd = sys.stdout.fileno()
+
+        def emit(text):
+            os.write(out_fd, text.encode("utf-8"))
+
         buffer = []
         cursor_pos = 0
 
         with InputHandler._terminal_mode():
             while True:
-                key = InputHandler._read_char_raw()
+                key = InputHandler._read_char_raw(batch=True)
 
                 # Handle Ctrl+C
                 if key == "\x03":
-                    sys.stdout.write("\n")
+                    emit("\n")
                     return None
 
                 # Handle ESC (Standalone)
                 if key == "\x1b":
-                    sys.stdout.write("\n")
+                    emit("\n")
                     return None
 
                 # Handle Enter
                 if key in ("\r", "\n"):
-                    sys.stdout.write("\n")
+                    emit("\n")
                     return "".join(buffer)
 
                 # Handle Backspace (127 is DEL on Mac/Linux, 8 is BS)
@@ -123,8 +221,7 @@ class InputHandler:
                         cursor_pos -= 1
                         # Move back, clear to end of line, print rest
                         tail = "".join(buffer[cursor_pos:])
-                        sys.stdout.write("\b" + tail + " " + "\b" * (len(tail) + 1))
-                        sys.stdout.flush()
+                        emit("\b" + tail + " " + "\b" * (len(tail) + 1))
                     continue
 
                 # Handle Arrow Keys (Escape Sequences)
@@ -133,76 +230,79 @@ class InputHandler:
                     if seq == "D":  # Left Arrow
                         if cursor_pos > 0:
                             cursor_pos -= 1
-                            sys.stdout.write("\033[D")
-                            sys.stdout.flush()
+                            emit("\033[D")
                     elif seq == "C":  # Right Arrow
                         if cursor_pos < len(buffer):
                             cursor_pos += 1
-                            sys.stdout.write("\033[C")
-                            sys.stdout.flush()
+                            emit("\033[C")
                     # Ignore Up/Down (A/B)
                     continue
 
                 # Handle Option+Left (Esc b) - Word Left
                 if key == "\x1bb":
+                    moved = 0
                     while cursor_pos > 0 and buffer[cursor_pos - 1] == " ":
                         cursor_pos -= 1
-                        sys.stdout.write("\033[D")
+                        moved += 1
                     while cursor_pos > 0 and buffer[cursor_pos - 1] != " ":
                         cursor_pos -= 1
-                        sys.stdout.write("\033[D")
-                    sys.stdout.flush()
+                        moved += 1
+                    if moved:
+                        emit(f"\033[{moved}D")
                     continue
 
                 # Handle Option+Right (Esc f) - Word Right
                 if key == "\x1bf":
+                    moved = 0
                     while cursor_pos < len(buffer) and buffer[cursor_pos] != " ":
                         cursor_pos += 1
-                        sys.stdout.write("\033[C")
+                        moved += 1
                     while cursor_pos < len(buffer) and buffer[cursor_pos] == " ":
                         cursor_pos += 1
-                        sys.stdout.write("\033[C")
-                    sys.stdout.flush()
+                        moved += 1
+                    if moved:
+                        emit(f"\033[{moved}C")
                     continue
 
                 # Handle Home (Ctrl+A)
                 if key == "\x01":
                     if cursor_pos > 0:
-                        sys.stdout.write(f"\033[{cursor_pos}D")
+                        emit(f"\033[{cursor_pos}D")
                         cursor_pos = 0
-                        sys.stdout.flush()
                     continue
 
                 # Handle End (Ctrl+E)
                 if key == "\x05":
                     if cursor_pos < len(buffer):
-                        sys.stdout.write(f"\033[{len(buffer) - cursor_pos}C")
+                        emit(f"\033[{len(buffer) - cursor_pos}C")
                         cursor_pos = len(buffer)
-                        sys.stdout.flush()
                     continue
 
                 # Handle Clear Line (Ctrl+U)
                 if key == "\x15":
-                    if cursor_pos > 0:
-                        sys.stdout.write(f"\033[{cursor_pos}D")
-                    sys.stdout.write("\033[K")
+                    echo = "\033[K" if cursor_pos == 0 else f"\033[{cursor_pos}D\033[K"
+                    emit(echo)
                     buffer = []
                     cursor_pos = 0
-                    sys.stdout.flush()
                     continue
 
-                # Handle Regular Printable Characters
-                if len(key) == 1 and key.isprintable():
-                    buffer.insert(cursor_pos, key)
-                    cursor_pos += 1
+                # Handle Regular Printable Characters; key may be a whole
+                # batched paste run, inserted and echoed in one write.
+                if key and key.isprintable():
+                    buffer[cursor_pos:cursor_pos] = key
+                    cursor_pos += len(key)
                     tail = "".join(buffer[cursor_pos:])
-                    sys.stdout.write(key + tail)
+                    echo = key + tail
                     if tail:
-                        sys.stdout.write(f"\033[{len(tail)}D")
-                    sys.stdout.flush()
+                        echo += f"\033[{len(tail)}D"
+                    emit(echo)
 
     @staticmethod
     def read_menu_choice(prompt, valid_choices):
+        # Normalize once: membership on a str is a substring search and on
+        # a list a linear scan; a frozenset is one hash probe per key.
+        if not isinstance(valid_choices, (set, frozenset)):
+            valid_choices = frozenset(valid_choices)
         sys.stdout.write(prompt)
         sys.stdout.flush()
         with InputHandler._terminal_mode():
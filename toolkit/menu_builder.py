@@ -8,6 +8,18 @@ from typing import Optional, Set
 
 from toolkit.input_handler import InputHandler
 
+# SGR/control sequences pre-encoded once at import so interactive frames can
+# be assembled as bytes without re-encoding per redraw
+_SGR_RESET = b"\x1b[0m"
+_SGR_SELECTED = Fore.CYAN.encode("ascii") + b"\x1b[1m"  # Bright cyan
+_SGR_DISABLED = Fore.LIGHTBLACK_EX.encode("ascii")
+_SGR_FORE_RESET = Fore.RESET.encode("ascii")
+_SYNC_BEGIN = b"\x1b[?2026h"
+_SYNC_END = b"\x1b[?2026l"
+_PREFIX_SELECTED = "▶ ".encode("utf-8")
+_PREFIX_NORMAL = b"  "
+_SELECTED_LABEL = "▶ Selected: ".encode("utf-8")
+
 
 class MenuBuilder:
     """Builds and displays consistent menus with styling, emojis, and colors."""
@@ -36,6 +48,7 @@ class MenuBuilder:
         self.footer = footer
         self.footer_color = footer_color
         self.options = []
+        self._valid_choices_cache = None
 
     def add_option(
         self,
@@ -55,6 +68,7 @@ class MenuBuilder:
             color: Colorama color for the option number
             enabled: Whether this option is enabled (disabled options shown in gray)
         """
+        emoji_part = f"{emoji} " if emoji else ""
         self.options.append(
             {
                 "number": number,
@@ -62,8 +76,13 @@ class MenuBuilder:
                 "emoji": emoji,
                 "color": color,
                 "enabled": enabled,
+                # Pre-encoded fragments for interactive frame composition
+                "_color_bytes": color.encode("ascii"),
+                "_number_bytes": f"{number}.".encode("utf-8"),
+                "_label_bytes": f" {emoji_part}{text}".encode("utf-8"),
             }
         )
+        self._valid_choices_cache = None
         return self  # Allow method chaining
 
     def display(self):
@@ -95,7 +114,11 @@ class MenuBuilder:
 
     def get_valid_choices(self) -> Set[str]:
         """Return a set of valid choice keys (only enabled options)."""
-        return {opt["number"] for opt in self.options if opt["enabled"]}
+        if self._valid_choices_cache is None:
+            self._valid_choices_cache = {
+                opt["number"] for opt in self.options if opt["enabled"]
+            }
+        return self._valid_choices_cache
 
     def get_all_choices(self) -> Set[str]:
         """Return a set of all choice keys (including disabled options)."""
@@ -118,163 +141,135 @@ class MenuBuilder:
             return "ESC"
 
         selected_index = 0
+        valid_choices = self.get_valid_choices()
 
-        def _render_menu():
-            """Render the menu with current selection highlighted."""
-            # Display title
-            if self.title:
-                title_text = ""
-                if self.title_emoji:
-                    title_text += f"{self.title_emoji} "
-                title_text += f"{self.title}"
-                print(self.title_color + title_text + "\n")
+        footer_bytes = (
+            (self.footer_color + self.footer).encode("utf-8") + b"\n\n"
+            if self.footer
+            else b""
+        )
 
-            # Save cursor position at start of menu options (for redraws)
-            sys.stdout.write("\033[s")  # Save cursor position
-            sys.stdout.flush()
+        def _compose_frame():
+            """Compose the options/footer/indicator block as bytes."""
+            buf = bytearray()
 
-            # Display options with highlighting
+            # Options with highlighting
             enabled_idx = 0
             for option in self.options:
                 if not option["enabled"]:
                     # Disabled option - show in gray
-                    number_color = Fore.LIGHTBLACK_EX
-                    text_color = Fore.LIGHTBLACK_EX
-                    prefix = "  "
+                    number_color = _SGR_DISABLED
+                    text_color = _SGR_DISABLED
+                    prefix = _PREFIX_NORMAL
                 elif enabled_idx == selected_index:
                     # Selected option - highlight with arrow
-                    number_color = Fore.CYAN + "\033[1m"  # Bright cyan
-                    text_color = Fore.CYAN + "\033[1m"
-                    prefix = "▶ "
+                    number_color = _SGR_SELECTED
+                    text_color = _SGR_SELECTED
+                    prefix = _PREFIX_SELECTED
                 else:
                     # Normal enabled option
-                    number_color = option["color"]
-                    text_color = Fore.RESET
-                    prefix = "  "
-
-                emoji_part = f"{option['emoji']} " if option["emoji"] else ""
-                print(
-                    prefix + number_color + f"{option['number']}."
-                    + text_color + f" {emoji_part}{option['text']}"
-                    + "\033[0m\n"  # Reset colors
-                )
+                    number_color = option["_color_bytes"]
+                    text_color = _SGR_FORE_RESET
+                    prefix = _PREFIX_NORMAL
+
+                buf += prefix
+                buf += number_color
+                buf += option["_number_bytes"]
+                buf += text_color
+                buf += option["_label_bytes"]
+                buf += _SGR_RESET  # Reset colors
+                buf += b"\n\n"
 
                 if option["enabled"]:
                     enabled_idx += 1
 
-            # Display footer
-            if self.footer:
-                print(self.footer_color + self.footer + "\n")
+            # Footer
+            buf += footer_bytes
 
-            # Show current selection indicator with full styling
+            # Current selection indicator with full styling
             selected_option = enabled_options[selected_index]
-            selected_emoji = selected_option.get('emoji', '')
-            emoji_part = f"{selected_emoji} " if selected_emoji else ""
-            print(f"{Fore.CYAN}\033[1m▶ Selected: {selected_option['number']}. {emoji_part}{selected_option['text']}\033[0m{Fore.RESET}")
-            print()  # Extra blank line for spacing
-
-            sys.stdout.flush()
-
-        # Initial render
-        _render_menu()
-
-        # Interactive selection loop
-        with InputHandler._terminal_mode():
-            while True:
-                key = InputHandler._read_char_raw()
-
-                # Handle Ctrl+C
-                if key == "\x03":
-                    sys.stdout.write("\n")
-                    return "ESC"
-
-                # Handle arrow keys (must check before standalone ESC)
-                if key.startswith("\x1b["):
-                    seq = key[2:]
-                    if seq == "A":  # Up arrow
-                        selected_index = (selected_index - 1) % len(enabled_options)
-                        # Restore cursor to menu start, clear to end, redraw
-                        sys.stdout.write("\033[u\033[J")  # Restore cursor, clear to end
-                        sys.stdout.flush()
-                        # Redraw options, footer, and indicator
-                        enabled_idx = 0
-                        for option in self.options:
-                            if not option["enabled"]:
-                                prefix = "  "
-                                number_color = Fore.LIGHTBLACK_EX
-                                text_color = Fore.LIGHTBLACK_EX
-                            elif enabled_idx == selected_index:
-                                prefix = "▶ "
-                                number_color = Fore.CYAN + "\033[1m"
-                                text_color = Fore.CYAN + "\033[1m"
-                            else:
-                                prefix = "  "
-                                number_color = option["color"]
-                                text_color = Fore.RESET
-
-                            emoji_part = f"{option['emoji']} " if option["emoji"] else ""
-                            print(prefix + number_color + f"{option['number']}." + text_color + f" {emoji_part}{option['text']}\033[0m\n")
-                            if option["enabled"]:
-                                enabled_idx += 1
-
-                        if self.footer:
-                            print(self.footer_color + self.footer + "\n")
-
-                        selected_option = enabled_options[selected_index]
-                        selected_emoji = selected_option.get('emoji', '')
-                        emoji_part = f"{selected_emoji} " if selected_emoji else ""
-                        print(f"{Fore.CYAN}\033[1m▶ Selected: {selected_option['number']}. {emoji_part}{selected_option['text']}\033[0m{Fore.RESET}\n")
-                        sys.stdout.flush()
-                    elif seq == "B":  # Down arrow
-                        selected_index = (selected_index + 1) % len(enabled_options)
-                        # Restore cursor to menu start, clear to end, redraw
-                        sys.stdout.write("\033[u\033[J")  # Restore cursor, clear to end
-                        sys.stdout.flush()
-                        # Redraw options, footer, and indicator
-                        enabled_idx = 0
-                        for option in self.options:
-                            if not option["enabled"]:
-                                prefix = "  "
-                                number_color = Fore.LIGHTBLACK_EX
-                                text_color = Fore.LIGHTBLACK_EX
-                            elif enabled_idx == selected_index:
-                                prefix = "▶ "
-                                number_color = Fore.CYAN + "\033[1m"
-                                text_color = Fore.CYAN + "\033[1m"
+            buf += _SGR_SELECTED
+            buf += _SELECTED_LABEL
+            buf += selected_option["_number_bytes"]
+            buf += selected_option["_label_bytes"]
+            buf += _SGR_RESET + _SGR_FORE_RESET + b"\n\n"
+
+            return bytes(buf)
+
+        def _emit(frame):
+            """Write a frame in one buffered write, bypassing the text layer."""
+            sys.stdout.flush()  # Drain anything pending in the text wrapper
+            sys.stdout.buffer.write(frame)
+            sys.stdout.buffer.flush()
+
+        # Hide the cursor for the duration of the interaction so terminals
+        # don't repaint the cursor glyph on every redraw
+        sys.stdout.write("\033[?25l")
+
+        try:
+            # Initial render: title, then save cursor position at the start
+            # of the options block for later redraws. The whole frame is
+            # wrapped in synchronized output so compliant terminals paint it
+            # at once instead of repainting per line.
+            header = _SYNC_BEGIN
+            if self.title:
+                title_text = ""
+                if self.title_emoji:
+                    title_text += f"{self.title_emoji} "
+                title_text += f"{self.title}"
+                header += (self.title_color + title_text).encode("utf-8") + b"\n\n"
+            header += b"\x1b[s"  # Save cursor position
+            _emit(header + _compose_frame() + _SYNC_END)
+
+            # Interactive selection loop
+            with InputHandler._terminal_mode():
+                while True:
+                    key = InputHandler._read_char_raw()
+
+                    # Handle Ctrl+C
+                    if key == "\x03":
+                        sys.stdout.write("\n")
+                        return "ESC"
+
+                    # Handle arrow keys (must check before standalone ESC)
+                    if key.startswith("\x1b["):
+                        seq = key[2:]
+                        if seq in ("A", "B"):  # Up / Down arrow
+                            if seq == "A":
+                                selected_index = (selected_index - 1) % len(
+                                    enabled_options
+                                )
                             else:
-                                prefix = "  "
-                                number_color = option["color"]
-                                text_color = Fore.RESET
-
-                            emoji_part = f"{option['emoji']} " if option["emoji"] else ""
-                            print(prefix + number_color + f"{option['number']}." + text_color + f" {emoji_part}{option['text']}\033[0m\n")
-                            if option["enabled"]:
-                                enabled_idx += 1
-
-                        if self.footer:
-                            print(self.footer_color + self.footer + "\n")
-
+                                selected_index = (selected_index + 1) % len(
+                                    enabled_options
+                                )
+                            # Begin synchronized frame, restore cursor to
+                            # menu start, clear to end, redraw in one write
+                            _emit(
+                                _SYNC_BEGIN
+                                + b"\x1b[u\x1b[J"
+                                + _compose_frame()
+                                + _SYNC_END
+                            )
+                        # Ignore left/right arrows (C/D)
+                        continue
+
+                    # Handle standalone ESC (after checking for escape sequences)
+                    if key == "\x1b":
+                        sys.stdout.write("\n")
+                        return "ESC"
+
+                    # Handle Enter
+                    if key in ("\r", "\n"):
                         selected_option = enabled_options[selected_index]
-                        selected_emoji = selected_option.get('emoji', '')
-                        emoji_part = f"{selected_emoji} " if selected_emoji else ""
-                        print(f"{Fore.CYAN}\033[1m▶ Selected: {selected_option['number']}. {emoji_part}{selected_option['text']}\033[0m{Fore.RESET}\n")
-                        sys.stdout.flush()
-                    # Ignore left/right arrows (C/D)
-                    continue
-
-                # Handle standalone ESC (after checking for escape sequences)
-                if key == "\x1b":
-                    sys.stdout.write("\n")
-                    return "ESC"
-
-                # Handle Enter
-                if key in ("\r", "\n"):
-                    selected_option = enabled_options[selected_index]
-                    sys.stdout.write("\n")
-                    return selected_option["number"]
-
-                # Handle direct number/letter selection
-                valid_choices = self.get_valid_choices()
-                if key in valid_choices:
-                    sys.stdout.write(key + "\n")
-                    return key
+                        sys.stdout.write("\n")
+                        return selected_option["number"]
+
+                    # Handle direct number/letter selection
+                    if key in valid_choices:
+                        sys.stdout.write(key + "\n")
+                        return key
+        finally:
+            # Always restore the cursor, including ESC/Ctrl+C paths
+            sys.stdout.write("\033[?25h")
+            sys.stdout.flush()
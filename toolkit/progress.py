@@ -3,6 +3,7 @@ Simple progress bar utility for displaying progress of long-running operations.
 """
 
 import sys
+import time
 from typing import Optional
 
 
@@ -17,6 +18,8 @@ class ProgressBar:
         length: int = 50,
         show_percentage: bool = True,
         show_count: bool = True,
+        throttle_hz: float = 20.0,
+        disable: bool = False,
     ):
         """
         Initialize a progress bar.
@@ -28,6 +31,8 @@ class ProgressBar:
             length: Length of the progress bar in characters
             show_percentage: Whether to show percentage
             show_count: Whether to show current/total count
+            throttle_hz: Maximum redraws per second (0 disables throttling)
+            disable: Force-disable rendering regardless of TTY detection
         """
         self.total = total
         self.prefix = prefix
@@ -37,6 +42,24 @@ class ProgressBar:
         self.show_count = show_count
         self.current = 0
         self._printed = False
+        self._min_interval = 1.0 / throttle_hz if throttle_hz > 0 else 0.0
+        self._last_render = 0.0
+        self._last_bar_key = None
+        # Preallocated bar halves; redraws slice these instead of building
+        # two fresh strings per frame.
+        self._full = "█" * length
+        self._empty = "░" * length
+        self._total_f = float(total) if total else 1.0
+        # Render to stderr so the bar never pollutes stdout when the
+        # program's output is piped; disable rendering entirely when
+        # stderr is not an interactive terminal.
+        self._stream = sys.stderr if (not disable and sys.stderr.isatty()) else None
+        self._pending = False
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the bar will actually render frames."""
+        return self._stream is not None
 
     def update(self, n: int = 1, custom_message: Optional[str] = None):
         """
@@ -65,9 +88,40 @@ class ProgressBar:
         if self.total == 0:
             return
 
-        percent = 100 * (self.current / float(self.total))
+        # Without an interactive terminal in-place redraws are useless
+        # noise; only finish() emits a summary line.
+        if self._stream is None:
+            self._pending = True
+            return
+
+        # Throttle redraws: terminal writes dominate tight update loops, so
+        # skip frames that land within the minimum interval. The final frame
+        # and custom messages always render.
+        now = time.monotonic()
+        if (
+            self.current < self.total
+            and custom_message is None
+            and (now - self._last_render) < self._min_interval
+        ):
+            return
+        self._last_render = now
+
+        percent = 100 * (self.current / self._total_f)
         filled_length = int(self.length * self.current // self.total)
-        bar = "█" * filled_length + "░" * (self.length - filled_length)
+
+        # Skip the write entirely when the rendered frame would be identical
+        # to the last one (common when total far exceeds the bar length).
+        bar_key = (
+            filled_length,
+            round(percent, 1) if self.show_percentage else None,
+            self.current if self.show_count else None,
+            custom_message,
+        )
+        if bar_key == self._last_bar_key:
+            return
+        self._last_bar_key = bar_key
+
+        bar = self._full[:filled_length] + self._empty[filled_length:]
 
         # Build the display string
         parts = [self.prefix]
@@ -78,9 +132,12 @@ class ProgressBar:
             parts.append(f"{percent:.1f}%")
         parts.append(custom_message if custom_message else self.suffix)
 
-        # Use carriage return to overwrite the line
-        sys.stdout.write("\r" + " ".join(parts))
-        sys.stdout.flush()
+        # Assemble the whole frame and issue a single write; flushing every
+        # frame is a syscall per tick, so only force it on the final frame
+        # (finish() flushes the rest).
+        self._stream.write("\r" + " ".join(parts))
+        if self.current == self.total:
+            self._stream.flush()
         self._printed = True
 
     def finish(self, message: Optional[str] = None):
@@ -91,14 +148,19 @@ class ProgressBar:
             message: Optional final message to display
         """
         if self._printed:
-            # Clear the line and move to next
-            sys.stdout.write("\r" + " " * (self.length + 50) + "\r")
+            # Erase the bar line: "erase entire line" is a handful of bytes
+            # versus pushing 100+ spaces through the terminal. _printed is
+            # only ever set on a TTY, so the escape sequence is safe here.
+            self._stream.write("\r\x1b[2K")
+            self._stream.flush()
+        if self._printed or self._pending:
             if message:
                 print(message)
             else:
                 print(f"{self.prefix} {self.suffix}: {self.current}/{self.total}")
             sys.stdout.flush()
         self._printed = False
+        self._pending = False
 
     def __enter__(self):
         """Context manager entry."""
@@ -114,6 +176,8 @@ def create_progress_bar(
     prefix: str = "Progress",
     suffix: str = "Complete",
     length: int = 50,
+    throttle_hz: float = 20.0,
+    disable: bool = False,
 ) -> ProgressBar:
     """
     Convenience function to create a progress bar.
@@ -123,8 +187,12 @@ def create_progress_bar(
         prefix: Text to display before the progress bar
         suffix: Text to display after the progress bar
         length: Length of the progress bar in characters
+        throttle_hz: Maximum redraws per second (0 disables throttling)
+        disable: Force-disable rendering regardless of TTY detection
 
     Returns:
         ProgressBar instance
     """
-    return ProgressBar(total, prefix, suffix, length)
+    return ProgressBar(
+        total, prefix, suffix, length, throttle_hz=throttle_hz, disable=disable
+    )
@@ -2,11 +2,11 @@
 CollectionManager class to centralize all collection-related operations.
 """
 
-import requests
 from urllib.parse import urlencode
 from colorama import Fore
 from toolkit import emojis
 from toolkit import constants
+from toolkit.services.plex_manager import ensure_session_retries
 from toolkit.utils import read_line, read_menu_choice, pause
 
 
@@ -21,6 +21,21 @@ class CollectionManager:
             library: Plex library section (e.g., from get_movie_library())
         """
         self.library = library
+        # Lazy cache of lowercased title -> collection. Interactive flows
+        # call find_collection several times per operation; one fetch per
+        # manager replaces a Plex round trip per call.
+        self._collections_by_title = None
+
+    def _load_cache(self):
+        if self._collections_by_title is None:
+            self._collections_by_title = {
+                c.title.lower(): c for c in self.library.collections()
+            }
+        return self._collections_by_title
+
+    def refresh(self):
+        """Drop the cached collection list; the next lookup refetches from Plex."""
+        self._collections_by_title = None
 
     def find_collection(self, collection_name):
         """
@@ -32,17 +47,7 @@ class CollectionManager:
         Returns:
             Collection object if found, None otherwise
         """
-        existing_collections = self.library.search(
-            title=collection_name, libtype=constants.PLEX_LIBTYPE_COLLECTION
-        )
-        return next(
-            (
-                c
-                for c in existing_collections
-                if c.title.lower() == collection_name.lower()
-            ),
-            None,
-        )
+        return self._load_cache().get(collection_name.lower())
 
     def collection_exists(self, collection_name):
         """
@@ -75,7 +80,7 @@ class CollectionManager:
         Returns:
             List of collection objects
         """
-        return self.library.collections()
+        return list(self._load_cache().values())
 
     def get_collection_items(self, collection_name):
         """
@@ -105,6 +110,8 @@ class CollectionManager:
         """
         try:
             collection = self.library.createCollection(collection_name, items=items)
+            if self._collections_by_title is not None:
+                self._collections_by_title[collection_name.lower()] = collection
             print(
                 f"\n{emojis.CHECK} Created collection '{collection_name}' with {len(items)} items."
             )
@@ -152,7 +159,12 @@ class CollectionManager:
         }
 
         url = server.url("/library/collections")
-        res = requests.post(url, headers=server._headers(), params=create_params)
+        # Reuse plexapi's pooled session (keepalive, no fresh TCP/TLS
+        # handshake) with retries for transient 5xx responses
+        session = ensure_session_retries(server._session)
+        res = session.post(
+            url, headers=server._headers(), params=create_params, timeout=30
+        )
 
         if res.status_code >= 400:
             raise Exception(f"HTTP {res.status_code}: {res.text}")
@@ -195,12 +207,15 @@ class CollectionManager:
             if confirm and confirm.lower() == "y":
                 print(Fore.YELLOW + f"Deleting '{collection_name}'..." + Fore.RESET)
                 existing.delete()
+                self._load_cache().pop(collection_name.lower(), None)
             else:
                 print("Canceled.")
                 return False
 
         try:
             self.library.createSmartCollection(collection_name, **smart_filter)
+            # Creation paths don't hand back the object; refetch lazily.
+            self.refresh()
             print(
                 f"\n{emojis.CHECK} Smart Collection '{collection_name}' created successfully!"
             )
@@ -216,6 +231,7 @@ class CollectionManager:
                     self._create_smart_collection_fallback(
                         collection_name, smart_filter
                     )
+                    self.refresh()
                     return True
                 except Exception as fallback_error:
                     print(
@@ -257,16 +273,11 @@ class CollectionManager:
             return None
 
         try:
-            current_items = collection.items()
-            current_keys = {str(x.ratingKey) for x in current_items}
-
-            to_add = []
-            skipped = 0
-            for item in items:
-                if str(item.ratingKey) not in current_keys:
-                    to_add.append(item)
-                else:
-                    skipped += 1
+            # ratingKey is an int on every plexapi media object, so compare
+            # raw keys instead of stringifying each one.
+            current_keys = {x.ratingKey for x in collection.items()}
+            to_add = [item for item in items if item.ratingKey not in current_keys]
+            skipped = len(items) - len(to_add)
 
             if to_add:
                 collection.addItems(to_add)
@@ -306,6 +317,7 @@ class CollectionManager:
 
         try:
             collection.delete()
+            self._load_cache().pop(collection_name.lower(), None)
             print(f"\n{emojis.CHECK} Deleted collection '{collection_name}'.")
             return True
         except Exception as e:
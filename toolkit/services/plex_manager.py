@@ -1,3 +1,5 @@
+import concurrent.futures
+
 from plexapi.server import PlexServer
 from plexapi.exceptions import NotFound, Unauthorized
 import requests
@@ -37,6 +39,24 @@ def clear_plex_manager_cache():
     _plex_manager_cache.clear()
 
 
+def ensure_session_retries(session):
+    """
+    Mount a retry adapter on a requests.Session (once) so transient 5xx
+    responses are retried with backoff. Returns the session for chaining.
+    """
+    if getattr(session, "_plextoolkit_retries", False):
+        return session
+
+    retry = requests.adapters.Retry(
+        total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504]
+    )
+    adapter = requests.adapters.HTTPAdapter(max_retries=retry)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session._plextoolkit_retries = True
+    return session
+
+
 class PlexManager:
     def __init__(self, token, base_url):
         try:
@@ -49,6 +69,8 @@ class PlexManager:
             raise ConnectionError(
                 "Failed to connect to Plex. Please check the URL and Token."
             ) from e
+        # Memoized studio lookups keyed by (library key, lowercased query).
+        self._studio_cache = {}
 
     def get_movie_library(self, library_name):
         try:
@@ -61,26 +83,72 @@ class PlexManager:
         return self.plex.library.sections()
 
     def get_items_by_studio(self, library, studio_name):
-        # Fetch all items and filter locally for better partial matching
-        # This catches "A24", "A24 Films", "A24 Productions", etc.
-        all_items = library.all()
-        query = studio_name.lower()
-        return [
-            item for item in all_items if item.studio and query in item.studio.lower()
-        ]
+        cache_key = (library.key, studio_name.lower())
+        if cache_key in self._studio_cache:
+            return self._studio_cache[cache_key]
+
+        try:
+            # Server-side filter: for string fields Plex treats '=' as a
+            # substring match, so this still catches "A24", "A24 Films",
+            # "A24 Productions", etc. without transferring the whole
+            # library over the wire.
+            items = library.search(filters={"studio": studio_name})
+        except Exception:
+            # Fall back to fetching everything and matching locally if the
+            # server or plexapi version rejects the studio filter.
+            all_items = library.all()
+            query = studio_name.lower()
+            items = [
+                item
+                for item in all_items
+                if item.studio and query in item.studio.lower()
+            ]
+
+        self._studio_cache[cache_key] = items
+        return items
 
     def find_movies(self, library, titles):
+        # Each title is a separate HTTP round trip to Plex, so fan the
+        # searches out over threads; plexapi shares a pooled session, and
+        # executor.map keeps results in input order.
         matched = []
-        for title in titles:
-            results = library.search(title)
-            if results:
-                matched.append((title, results[0]))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+            for title, results in zip(titles, executor.map(library.search, titles)):
+                if results:
+                    matched.append((title, results[0]))
         return matched
 
     def add_to_collection(self, items, collection_name):
-        for title, media in items:
-            media.addCollection(collection_name)
-            media.reload()
+        if not items:
+            return
+
+        media_list = [media for _, media in items]
+        try:
+            # One PUT for the whole batch instead of addCollection+reload
+            # per item. The collection is resolved inline rather than via
+            # CollectionManager to avoid a circular import.
+            library = media_list[0].section()
+            collection = next(
+                (
+                    c
+                    for c in library.search(
+                        title=collection_name,
+                        libtype=constants.PLEX_LIBTYPE_COLLECTION,
+                    )
+                    if c.title.lower() == collection_name.lower()
+                ),
+                None,
+            )
+            if collection is None:
+                library.createCollection(collection_name, items=media_list)
+            else:
+                collection.addItems(media_list)
+        except Exception:
+            # Older plexapi versions: fall back to tagging items one at a time.
+            for title, media in items:
+                media.addCollection(collection_name)
+
+        for title, _ in items:
             print(f"{emojis.CHECK} Added '{title}' to collection: {collection_name}")
 
     def _set_tmdb_image(self, item, image_type, include_locked=False):
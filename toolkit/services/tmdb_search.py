@@ -1,15 +1,87 @@
+import asyncio
+import concurrent.futures
+import json
+
 from tmdbv3api import TMDb, Search, Collection
 import requests
 from toolkit.progress import ProgressBar
 
+# httpx can multiplex all page GETs over a single HTTP/2 connection,
+# avoiding per-connection TLS setup; threaded requests is the fallback.
+# AsyncClient(http2=True) needs the h2 package (httpx[http2]) at
+# construction time, so require both before taking the async path.
+try:
+    import h2  # noqa: F401
+    import httpx
+except ImportError:
+    httpx = None
+
+# orjson parses straight from bytes in C, skipping the UTF-8 decode and
+# running several times faster than stdlib json; fall back when missing.
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
 
 class TMDbSearch:
+    # Cap concurrent page fetches so we stay inside TMDb's rate limits.
+    _MAX_WORKERS = 8
+
     def __init__(self, api_key):
         self.tmdb = TMDb()
         self.tmdb.api_key = api_key
         self.tmdb.language = "en"
         self.tmdb.debug = True
         self.search = Search()
+        # Persistent session: keepalive connections amortize the TCP/TLS
+        # handshake across page fetches, and the pool sizing lets the
+        # thread fan-out in discover_movies share connections.
+        self._session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=10, pool_maxsize=20)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
+    @staticmethod
+    def _check_response(resp):
+        """Raise on TMDb error statuses (works for requests and httpx responses)."""
+        if resp.status_code == 401:
+            raise ValueError("TMDb authentication failed (invalid API key).")
+        if resp.status_code != 200:
+            snippet = ""
+            try:
+                snippet = resp.json().get("status_message", "")
+            except Exception:
+                snippet = resp.text[:200]
+            raise RuntimeError(f"TMDb error {resp.status_code}: {snippet}")
+
+    def _fetch_page(self, url, params):
+        """Fetch one API page and return the parsed JSON, raising on errors."""
+        resp = self._session.get(url, params=params, timeout=10)
+        self._check_response(resp)
+        return _loads(resp.content)
+
+    async def _fetch_pages_async(self, url, page_params, on_page):
+        """
+        Fetch all page_params concurrently over one HTTP/2 connection,
+        calling on_page(data) as each response arrives.
+        """
+        limits = httpx.Limits(max_connections=self._MAX_WORKERS)
+        async with httpx.AsyncClient(
+            http2=True, limits=limits, timeout=10
+        ) as client:
+
+            async def fetch(params):
+                resp = await client.get(url, params=params)
+                self._check_response(resp)
+                return _loads(resp.content)
+
+            for coro in asyncio.as_completed(
+                [fetch(params) for params in page_params]
+            ):
+                on_page(await coro)
 
     def search_movies(self, keyword, limit=10):
         results = self.search.movies(keyword)
@@ -58,77 +130,85 @@ class TMDbSearch:
         if keyword_id:
             queries.append({"with_keywords": keyword_id})
 
-        all_titles = set()
-        total_pages = 0
+        # Dedup on (title, year) tuples; the display string is only built
+        # once per unique movie at the end instead of once per result row.
+        all_pairs = set()
+
+        def collect(data):
+            for m in data.get("results", []):
+                title = m.get("title")
+                date = m.get("release_date")
+                if title:
+                    year = date[:4] if date and len(date) >= 4 else None
+                    all_pairs.add((title, year))
 
-        # First pass: determine total pages for progress bar
+        # Page 1 of each query carries total_pages alongside its results,
+        # so one fetch per query both seeds the title set and sizes the
+        # progress bar -- no separate counting pass.
+        total_pages = 0
+        pages_per_query = []
         for query_params in queries:
             current_params = params.copy()
             current_params.update(query_params)
             current_params["page"] = 1
-            resp = requests.get(url, params=current_params, timeout=10)
-            if resp.status_code == 401:
-                raise ValueError("TMDb authentication failed (invalid API key).")
-            if resp.status_code != 200:
-                snippet = ""
-                try:
-                    snippet = resp.json().get("status_message", "")
-                except Exception:
-                    snippet = resp.text[:200]
-                raise RuntimeError(f"TMDb error {resp.status_code}: {snippet}")
-            data = resp.json()
-            total_pages += data.get("total_pages", 1)
-
-        # Second pass: fetch all pages with progress bar
+            data = self._fetch_page(url, current_params)
+            collect(data)
+            query_pages = data.get("total_pages", 1)
+            pages_per_query.append(query_pages)
+            total_pages += query_pages
+
         if total_pages > 1:
-            print(f"\nFetching {total_pages} pages from TMDb...")
             progress = ProgressBar(
                 total_pages,
                 prefix="TMDb Discovery",
                 suffix="pages fetched",
                 length=40,
             )
+            if progress.enabled:
+                print(f"\nFetching {total_pages} pages from TMDb...")
+            progress.set(len(queries))
         else:
             progress = None
 
-        for query_params in queries:
-            # Merge base params with specific query params
-            current_params = params.copy()
-            current_params.update(query_params)
-            current_params["page"] = 1
+        page_params = []
+        for query_params, query_pages in zip(queries, pages_per_query):
+            base_params = params.copy()
+            base_params.update(query_params)
+            page_params.extend(
+                {**base_params, "page": page} for page in range(2, query_pages + 1)
+            )
 
-            while True:
-                if progress:
-                    progress.update(
-                        custom_message=f"Page {current_params['page']}/{current_params.get('total_pages', '?')}"
-                    )
-                resp = requests.get(url, params=current_params, timeout=10)
-                if resp.status_code == 401:
-                    if progress:
-                        progress.finish()
-                    raise ValueError("TMDb authentication failed (invalid API key).")
-                if resp.status_code != 200:
-                    if progress:
-                        progress.finish()
-                    snippet = ""
-                    try:
-                        snippet = resp.json().get("status_message", "")
-                    except Exception:
-                        snippet = resp.text[:200]
-                    raise RuntimeError(f"TMDb error {resp.status_code}: {snippet}")
-                data = resp.json()
-                for m in data.get("results", []):
-                    title = m.get("title")
-                    date = m.get("release_date")
-                    if title:
-                        if date and len(date) >= 4:
-                            all_titles.add(f"{title} ({date[:4]})")
-                        else:
-                            all_titles.add(title)
-                if data.get("page", 1) >= data.get("total_pages", 1):
-                    break
-                current_params["page"] += 1
+        def on_page(data):
+            collect(data)
+            if progress:
+                progress.update()
+
+        # Remaining pages are pure I/O: multiplex them over one HTTP/2
+        # connection when httpx is installed, otherwise fan out across
+        # threads. Either way results merge through on_page in completion
+        # order.
+        try:
+            if httpx is not None and page_params:
+                asyncio.run(self._fetch_pages_async(url, page_params, on_page))
+            elif page_params:
+                with concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self._MAX_WORKERS
+                ) as executor:
+                    futures = [
+                        executor.submit(self._fetch_page, url, page)
+                        for page in page_params
+                    ]
+                    for future in concurrent.futures.as_completed(futures):
+                        on_page(future.result())
+        except Exception:
+            if progress:
+                progress.finish()
+            raise
 
         if progress:
-            progress.finish(f"Found {len(all_titles)} unique movies.")
-        return sorted(list(all_titles))
+            progress.finish(
+                f"Found {len(all_pairs)} unique movies across {total_pages} pages."
+            )
+        return sorted(
+            f"{title} ({year})" if year else title for title, year in all_pairs
+        )
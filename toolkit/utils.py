@@ -1,3 +1,5 @@
+import copy
+import functools
 import json
 import os
 import re
@@ -5,6 +7,47 @@ import sys
 from colorama import Fore
 from toolkit.input_handler import InputHandler
 
+# orjson parses and serializes bytes in C, several times faster than the
+# stdlib; fall back when missing (same pattern as the TMDb client).
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+else:
+    _json_loads = json.loads
+
+    def _json_dumps(obj):
+        return json.dumps(obj, indent=4).encode("utf-8")
+
+
+# Compiled once: these run on every title parsed or normalized, so skip
+# even re's pattern-cache probe per call.
+_TITLE_YEAR_RE = re.compile(r"^(.*?)\s*\((\d{4})\)$")
+_PUNCT_RE = re.compile(r"[^\w\s]")
+
+# Deletion table for str.translate, built lazily on first use with
+# _PUNCT_RE as the oracle so the two stay in sync. translate walks the
+# string once in C instead of running the regex engine per title; the
+# table covers the Basic Multilingual Plane, which spans any character
+# that realistically appears in a Plex title.
+_PUNCT_TABLE = None
+
+
+def _punct_table():
+    global _PUNCT_TABLE
+    if _PUNCT_TABLE is None:
+        _PUNCT_TABLE = {
+            cp: None for cp in range(0x10000) if _PUNCT_RE.match(chr(cp))
+        }
+    return _PUNCT_TABLE
+
 
 class UserAbort(Exception):
     """Exception raised when user aborts an action."""
@@ -12,19 +55,25 @@ class UserAbort(Exception):
     pass
 
 
+_ESC_VALUES = frozenset({"esc", "escape", "\x1b"})
+
+
 def is_escape(value):
     if not value:
         return False
-    val = value.strip().lower()
-    return val == "esc" or val == "escape" or val == "\x1b"
+    # Fast path: the raw ESC keystroke, no strip/lower allocations.
+    if value == "\x1b":
+        return True
+    return value.strip().lower() in _ESC_VALUES
 
 
 def clear_screen():
     """Clears the terminal screen in a cross-platform way."""
-    if os.name == "nt":
-        os.system("cls")
-    else:
-        os.system("clear")
+    # Two escape sequences (home + erase display) instead of spawning a
+    # cls/clear subprocess. colorama's init() in main translates these
+    # for Windows consoles that lack native ANSI support.
+    sys.stdout.write("\x1b[H\x1b[2J")
+    sys.stdout.flush()
 
 
 def get_single_keypress():
@@ -69,28 +118,67 @@ def read_menu_choice(prompt, valid_choices):
     return InputHandler.read_menu_choice(prompt, valid_choices)
 
 
+@functools.lru_cache(maxsize=None)
 def get_config_path():
-    return os.path.join(os.path.dirname(__file__), "..", "config.json")
+    # __file__ never moves during a run; compute (and normalize away the
+    # "..") once instead of rebuilding the path on every config access.
+    return os.path.normpath(
+        os.path.join(os.path.dirname(__file__), "..", "config.json")
+    )
+
+
+# Single-entry config cache keyed on (path, mtime_ns, size); repeated
+# load_config calls skip the read and JSON decode until the file changes.
+# Copies go in and out so caller-side mutation (e.g. env-var overrides in
+# main) can't leak into what later loads report as file contents.
+_CONFIG_CACHE = {}
 
 
 def load_config():
     config_path = get_config_path()
-    if not os.path.exists(config_path):
+    try:
+        st = os.stat(config_path)
+    except OSError:
         return {}
+
+    key = (config_path, st.st_mtime_ns, st.st_size)
+    cached = _CONFIG_CACHE.get(key)
+    if cached is not None:
+        return copy.deepcopy(cached)
+
     try:
-        with open(config_path, "r") as f:
-            return json.load(f)
-    except (json.JSONDecodeError, IOError):
+        with open(config_path, "rb") as f:
+            config = _json_loads(f.read())
+    except (ValueError, IOError):
         return {}
 
+    _CONFIG_CACHE.clear()
+    _CONFIG_CACHE[key] = copy.deepcopy(config)
+    return config
+
 
 def save_config(config):
     config_path = get_config_path()
     try:
-        with open(config_path, "w") as f:
-            json.dump(config, f, indent=4)
+        # Serialize first, then write the whole buffer at once: json.dump
+        # streams many tiny writes through iterencode, one per token.
+        data = _json_dumps(config)
+        with open(config_path, "wb") as f:
+            f.write(data)
     except IOError as e:
         print(Fore.RED + f"Error saving config: {e}" + Fore.RESET)
+        return
+
+    # Seed the cache with what was just written so the next load_config
+    # doesn't re-read the file.
+    _CONFIG_CACHE.clear()
+    try:
+        st = os.stat(config_path)
+        _CONFIG_CACHE[(config_path, st.st_mtime_ns, st.st_size)] = copy.deepcopy(
+            config
+        )
+    except OSError:
+        pass
 
 
 def print_grid(items, columns=1, padding=20, title=None, sort=True):
@@ -100,50 +188,72 @@ def print_grid(items, columns=1, padding=20, title=None, sort=True):
     if not items:
         return
 
-    item_list = list(items)
+    # Only the string form is ever displayed, so stringify each item once
+    # up front; sorting and formatting both reuse it.
+    item_list = [str(item) for item in items]
     if sort:
-        item_list.sort(key=lambda x: str(x).lower())
+        # C-dispatched key, no Python lambda frame per comparison.
+        item_list.sort(key=str.lower)
 
-    # Row-major printing
-    for i in range(0, len(item_list), columns):
-        row_items = item_list[i : i + columns]
-        line = ""
-        for item in row_items:
-            line += f"{str(item):<{padding}}"
-        print(line)
+    # Row-major layout, assembled into one buffer and emitted with a
+    # single write instead of a syscall per row.
+    rows = [
+        "".join(f"{item:<{padding}}" for item in item_list[i : i + columns])
+        for i in range(0, len(item_list), columns)
+    ]
+    sys.stdout.write("\n".join(rows) + "\n")
+    sys.stdout.flush()
 
 
 def pick_from_list_case_insensitive(prompt, options):
     # options is a list of strings
     # returns the matching string from options, or None if cancelled
+    # Lowercase the options once up front; each attempt is then a single
+    # dict lookup instead of re-lowercasing the whole list.
+    lookup = {opt.lower(): opt for opt in options}
+
     while True:
         user_input = read_line(prompt)
         if user_input is None:
             return None
-        user_input = user_input.strip()
 
-        # Exact match check
-        for opt in options:
-            if opt.lower() == user_input.lower():
-                return opt
+        match = lookup.get(user_input.strip().lower())
+        if match is not None:
+            return match
 
         print(Fore.RED + "Item not found in list. Please try again." + Fore.RESET)
 
 
+@functools.lru_cache(maxsize=4096)
 def extract_title_and_year(text):
     # Returns (title, year_int_or_None)
+    # Memoized: matching re-parses the same raw titles many times per run.
     text = text.strip()
-    match = re.search(r"^(.*?)\s*\((\d{4})\)$", text)
+    # Fast path for the usual "Title (YYYY)" shape: three slice checks
+    # instead of invoking the regex engine. isdecimal() accepts exactly
+    # what int() does; isdigit() also passes superscripts, which int()
+    # would raise on.
+    if (
+        len(text) >= 7
+        and text[-1] == ")"
+        and text[-6] == "("
+        and text[-5:-1].isdecimal()
+    ):
+        return text[:-6].rstrip(), int(text[-5:-1])
+    match = _TITLE_YEAR_RE.search(text)
     if match:
         return match.group(1).strip(), int(match.group(2))
     return text, None
 
 
+@functools.lru_cache(maxsize=4096)
 def normalize_title(title):
     # Remove punctuation and lowercase
+    # Memoized: the same Plex titles are normalized repeatedly across
+    # successive searches, so repeats collapse to a dict lookup.
     if not title:
         return ""
-    cleaned = re.sub(r"[^\w\s]", "", title).lower()
+    cleaned = title.translate(_punct_table()).lower()
     return " ".join(cleaned.split())
 
 
@@ -157,8 +267,12 @@ def read_index_or_skip(max_index, prompt):
         if is_escape(val) or val.lower() == "s":
             return None
 
-        if val.isdigit():
+        # int() already rejects non-digits, so skip the separate isdigit scan.
+        try:
             idx = int(val)
+        except ValueError:
+            pass
+        else:
             if 1 <= idx <= max_index:
                 return idx
 
@@ -170,11 +284,22 @@ def pause(msg: str = "Press Enter or Esc to return to the menu..."):
     read_line(msg)
 
 
+# Parsed fallback_collections.json shared across sections, keyed on
+# (path, mtime_ns) so an edited file is picked up automatically.
+_FALLBACK_CACHE = {"key": None, "data": None}
+
+
 def load_fallback_data(section):
     # Load fallback data for a given section from fallback_collections.json.
-    fallback_path = os.path.join(
-        os.path.dirname(__file__), "..", "data", "fallback_collections.json"
+    fallback_path = os.path.normpath(
+        os.path.join(
+            os.path.dirname(__file__), "..", "data", "fallback_collections.json"
+        )
     )
-    with open(fallback_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
-    return data.get(section, {})
+    key = (fallback_path, os.stat(fallback_path).st_mtime_ns)
+    if _FALLBACK_CACHE["key"] != key:
+        with open(fallback_path, "rb") as f:
+            # One read + loads beats json.load's incremental reads here.
+            _FALLBACK_CACHE["data"] = _json_loads(f.read())
+        _FALLBACK_CACHE["key"] = key
+    return _FALLBACK_CACHE["data"].get(section, {})